@@ -39,9 +39,31 @@ async function apiFetch<T>(path: string, options?: RequestInit): Promise<T> {
 
 export type HoldRecordWithSite = HoldRecord & { site_name: string };
 
-export interface PagedResponse<T> {
+/** Hold history rows (GET /api/holds) — weather_snapshot is omitted from the list. */
+export type HoldHistoryRecord = Omit<HoldRecord, "weather_snapshot"> & { site_name: string };
+
+export interface PagedResponse<T, C = Record<string, string>> {
   items: T[];
   total: number;
+  /** Pass back to fetch the next page by keyset; null on the last page. */
+  next_cursor: C | null;
+}
+
+export interface HoldsCursor {
+  before_triggered_at: string;
+  before_id: string;
+}
+
+export interface LogsCursor {
+  before_sent_at: string;
+  before_id: string;
+}
+
+function cursorQuery(cursor?: object): string {
+  if (!cursor) return "";
+  return Object.entries(cursor)
+    .map(([k, v]) => `&${k}=${encodeURIComponent(String(v))}`)
+    .join("");
 }
 
 export const api = {
@@ -56,9 +78,9 @@ export const api = {
       siteId ? `/api/holds/active?site_id=${siteId}` : "/api/holds/active"
     ),
 
-  getHolds: (page = 0, pageSize = 25) =>
-    apiFetch<PagedResponse<HoldRecordWithSite>>(
-      `/api/holds?page=${page}&page_size=${pageSize}`
+  getHolds: (page = 0, pageSize = 25, cursor?: HoldsCursor) =>
+    apiFetch<PagedResponse<HoldHistoryRecord, HoldsCursor>>(
+      `/api/holds?page=${page}&page_size=${pageSize}${cursorQuery(cursor)}`
     ),
 
   createHold: (data: { site_id: string; trigger_rule: string; issued_by: string; hold_duration_mins?: number | null }) =>
@@ -76,9 +98,9 @@ export const api = {
   clearHold: (holdId: string) =>
     apiFetch<HoldRecord>(`/api/holds/${holdId}/clear`, { method: "PATCH" }),
 
-  getLogs: (page = 0, pageSize = 50) =>
-    apiFetch<PagedResponse<NotificationRecord & { site_name: string; trigger_rule: string | null }>>(
-      `/api/logs?page=${page}&page_size=${pageSize}`
+  getLogs: (page = 0, pageSize = 50, cursor?: LogsCursor) =>
+    apiFetch<PagedResponse<NotificationRecord & { site_name: string; trigger_rule: string | null }, LogsCursor>>(
+      `/api/logs?page=${page}&page_size=${pageSize}${cursorQuery(cursor)}`
     ),
 
   sendCustomMessage: (siteId: string, data: { message: string; device_ids: string[] }) =>
@@ -87,7 +109,7 @@ export const api = {
     ),
 
   getSiteLogs: (siteId: string, pageSize = 20) =>
-    apiFetch<PagedResponse<NotificationRecord & { site_name: string; trigger_rule: string | null }>>(
+    apiFetch<PagedResponse<NotificationRecord & { site_name: string; trigger_rule: string | null }, LogsCursor>>(
       `/api/logs?site_id=${siteId}&page_size=${pageSize}`
     ),
 
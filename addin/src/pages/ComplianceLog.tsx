@@ -2,7 +2,7 @@ import { useEffect, useState } from "react";
 import { Button, ButtonType } from "@geotab/zenith";
 import { jsPDF } from "jspdf";
 import autoTable from "jspdf-autotable";
-import { api } from "../lib/api.js";
+import { api, type HoldHistoryRecord, type HoldsCursor } from "../lib/api.js";
 import type { HoldRecord } from "../lib/types.js";
 import { useGeotabApi } from "../lib/geotabContext.js";
 import { Tooltip } from "../components/Tooltip.js";
@@ -23,9 +23,7 @@ const RULE_BADGE: Record<string, string> = {
 
 const PAGE_SIZE = 25;
 
-type HoldWithSite = HoldRecord & { site_name: string };
-
-function durationLabel(hold: HoldRecord): string {
+function durationLabel(hold: Pick<HoldRecord, "triggered_at" | "all_clear_at">): string {
   if (!hold.all_clear_at) return "Active";
   const ms = new Date(hold.all_clear_at).getTime() - new Date(hold.triggered_at).getTime();
   const mins = Math.round(ms / 60_000);
@@ -34,7 +32,7 @@ function durationLabel(hold: HoldRecord): string {
 
 export function ComplianceLog() {
   const { session } = useGeotabApi();
-  const [holds, setHolds] = useState<HoldWithSite[]>([]);
+  const [holds, setHolds] = useState<HoldHistoryRecord[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [page, setPage] = useState(0);
@@ -44,13 +42,13 @@ export function ComplianceLog() {
   async function exportPDF() {
     setExporting(true);
     try {
-      let allHolds: HoldWithSite[] = [];
-      let fetchPage = 0;
+      let allHolds: HoldHistoryRecord[] = [];
+      let cursor: HoldsCursor | undefined;
       while (true) {
-        const { items, total } = await api.getHolds(fetchPage, 500);
-        allHolds = allHolds.concat(items as HoldWithSite[]);
-        if (allHolds.length >= total) break;
-        fetchPage++;
+        const { items, next_cursor } = await api.getHolds(0, 500, cursor);
+        allHolds = allHolds.concat(items);
+        if (!next_cursor) break;
+        cursor = next_cursor;
       }
 
       const doc = new jsPDF({ orientation: "landscape" });
@@ -93,7 +91,7 @@ export function ComplianceLog() {
       setLoading(true);
       try {
         const { items, total } = await api.getHolds(page, PAGE_SIZE);
-        setHolds(items as HoldWithSite[]);
+        setHolds(items);
         setTotalCount(total);
         setError(null);
       } catch (err) {
@@ -147,7 +147,7 @@ export function Dashboard() {
             </Button>
           </div>
           {triggerResult === "ok" && (
-            <p className="text-xs text-green-600 font-medium">Poll complete — dashboard refreshed</p>
+            <p className="text-xs text-green-600 font-medium">Poll started — dashboard will update shortly</p>
           )}
           {triggerResult === "error" && (
             <p className="text-xs text-red-500 font-medium">Poll failed — check API logs</p>
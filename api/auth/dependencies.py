@@ -1,5 +1,16 @@
+import hashlib
+
+from cachetools import TTLCache
 from fastapi import Header, HTTPException
-from .geotab import verify_geotab_session
+from .geotab import CACHE_TTL, verify_geotab_session
+
+# Header-triple fast path in front of verify_geotab_session's cache, with the
+# same (user, session, database) key — it saves the await and shard lookup on
+# the hot path. The TTL is 5s shorter so the layers don't expire together:
+# when an entry drops out here, the next request refills it from the session
+# cache instead of every concurrent request going to Geotab at once. A verified
+# session can therefore be reused for up to 2 × CACHE_TTL - 5 seconds.
+_fast: TTLCache = TTLCache(maxsize=8192, ttl=CACHE_TTL - 5)
 
 
 async def get_current_user(
@@ -10,8 +21,18 @@ async def get_current_user(
     if not x_geotab_user or not x_geotab_session or not x_geotab_database:
         raise HTTPException(status_code=401, detail="Missing Geotab session headers")
 
-    return await verify_geotab_session(
+    key = hashlib.blake2b(
+        f"{x_geotab_user}|{x_geotab_session}|{x_geotab_database}".encode(),
+        digest_size=16,
+    ).digest()
+    user = _fast.get(key)
+    if user is not None:
+        return user
+
+    user = await verify_geotab_session(
         username=x_geotab_user,
         session_id=x_geotab_session,
         database=x_geotab_database,
     )
+    _fast[key] = user
+    return user
@@ -1,48 +1,117 @@
+import asyncio
 import os
-import time
 
 import httpx
+import orjson
+from cachetools import TTLCache
 from fastapi import HTTPException
 
-_cache: dict[str, tuple[float, dict]] = {}  # session_id → (timestamp, user_info)
+from http_client import make_geotab_client
+
 CACHE_TTL = 30  # seconds
+CACHE_MAX_SESSIONS = 4096
+_SHARD_COUNT = 16  # power of two — shards are picked with a bit-mask
+
+_SessionKey = tuple[str, str, str]
+
+# (username, session_id, database) → user_info, split into small bounded LRU
+# shards so each one stays cheap to resize and sweep. Stale entries are dropped
+# on access. Keyed on the full triple so a session id presented with another
+# user or database is verified against Geotab rather than served from cache.
+_shards: list[TTLCache] = [
+    TTLCache(maxsize=CACHE_MAX_SESSIONS // _SHARD_COUNT, ttl=CACHE_TTL)
+    for _ in range(_SHARD_COUNT)
+]
+_next_sweep = 0
+
+
+def _shard(key: _SessionKey) -> TTLCache:
+    return _shards[hash(key) & (_SHARD_COUNT - 1)]
+
+
+def _sweep_one_shard() -> None:
+    """Expire one shard per call, round-robin, so eviction work stays bounded."""
+    global _next_sweep
+    _shards[_next_sweep].expire()
+    _next_sweep = (_next_sweep + 1) & (_SHARD_COUNT - 1)
+
+
+# Same key → in-flight Geotab lookup, so concurrent cache misses share one call
+_inflight: dict[_SessionKey, asyncio.Task] = {}
 
 GEOTAB_API_URL = f"https://{os.environ.get('GEOTAB_SERVER', 'my.geotab.com')}/apiv1"
+ALLOWED_DATABASE = os.environ.get("GEOTAB_DATABASE", "")
+
+# Shared client so cache-miss lookups reuse pooled TLS connections to Geotab
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = make_geotab_client(timeout=10.0)
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 async def verify_geotab_session(username: str, session_id: str, database: str) -> dict:
-    cached = _cache.get(session_id)
-    if cached and time.time() - cached[0] < CACHE_TTL:
-        return cached[1]
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            GEOTAB_API_URL,
-            json={
-                "method": "Get",
-                "params": {
-                    "typeName": "User",
-                    "credentials": {
-                        "userName": username,
-                        "sessionId": session_id,
-                        "database": database,
-                    },
+    key = (username, session_id, database)
+    cached = _shard(key).get(key)
+    if cached is not None:
+        return cached
+
+    _sweep_one_shard()
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_lookup_session(username, session_id, database))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _lookup_done(key, t))
+
+    # Shield so one cancelled request doesn't cancel the lookup for the others
+    return await asyncio.shield(task)
+
+
+def _lookup_done(key: _SessionKey, task: asyncio.Task) -> None:
+    _inflight.pop(key, None)
+    # Mark the exception retrieved — if every waiter was cancelled, nobody else will
+    if not task.cancelled():
+        task.exception()
+
+
+async def _lookup_session(username: str, session_id: str, database: str) -> dict:
+    response = await _get_client().post(
+        GEOTAB_API_URL,
+        content=orjson.dumps({
+            "method": "Get",
+            "params": {
+                "typeName": "User",
+                "credentials": {
+                    "userName": username,
+                    "sessionId": session_id,
+                    "database": database,
                 },
             },
-            timeout=10,
-        )
+        }),
+        headers={"content-type": "application/json"},
+    )
 
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid Geotab session")
     if "error" in data:
         raise HTTPException(status_code=401, detail="Invalid Geotab session")
 
-    allowed_db = os.environ.get("GEOTAB_DATABASE", "")
-    if allowed_db and database != allowed_db:
+    if ALLOWED_DATABASE and database != ALLOWED_DATABASE:
         raise HTTPException(status_code=403, detail="Forbidden")
 
     user_info = {"username": username, "database": database}
-    _cache[session_id] = (time.time(), user_info)
+    key = (username, session_id, database)
+    _shard(key)[key] = user_info
     return user_info
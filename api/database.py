@@ -1,12 +1,33 @@
-import json
+"""
+asyncpg connection pool and row-serialisation helpers.
+
+Pool size is per process. Under `uvicorn --workers N` each worker opens its
+own pool, so the total connection count is N × PG_POOL_MAX. Size it as
+
+    PG_POOL_MAX = (postgres max_connections / N) - headroom
+
+leaving headroom for migrations, psql sessions and Railway's own tooling.
+"""
+
 import os
 import uuid
 from datetime import datetime
 
 import asyncpg
+import orjson
 from fastapi import Request
 
 
+# Binary jsonb wire format is a version byte (1) followed by the JSON text, so
+# orjson's bytes go straight onto the wire with no str round trip
+def _jsonb_encode(value) -> bytes:
+    return b"\x01" + orjson.dumps(value)
+
+
+def _jsonb_decode(data: bytes):
+    return orjson.loads(data[1:])
+
+
 async def create_pool() -> asyncpg.Pool:
     url = os.environ["DATABASE_URL"]
 
@@ -14,12 +35,31 @@ async def create_pool() -> asyncpg.Pool:
         await conn.set_type_codec(
             "jsonb",
             schema="pg_catalog",
-            encoder=json.dumps,
-            decoder=json.loads,
-            format="text",
+            encoder=_jsonb_encode,
+            decoder=_jsonb_decode,
+            format="binary",
+        )
+        await conn.set_type_codec(
+            "json",
+            schema="pg_catalog",
+            encoder=orjson.dumps,
+            decoder=orjson.loads,
+            format="binary",
         )
 
-    return await asyncpg.create_pool(url, init=_init)
+    return await asyncpg.create_pool(
+        url,
+        init=_init,
+        min_size=int(os.environ.get("PG_POOL_MIN", "2")),
+        max_size=int(os.environ.get("PG_POOL_MAX", "20")),
+        max_inactive_connection_lifetime=300,
+        # Prepared statements are cached per connection, keyed by SQL text —
+        # keep query strings constant (bind values as $n, never interpolate)
+        statement_cache_size=1024,
+        command_timeout=30,
+        # Short OLTP queries only — JIT compilation costs more than it saves
+        server_settings={"jit": "off"},
+    )
 
 
 async def close_pool(pool: asyncpg.Pool) -> None:
@@ -31,18 +71,47 @@ def get_pool(request: Request):
     return request.app.state.pool
 
 
+async def fetch_sites_with_state(pool: asyncpg.Pool) -> list[asyncpg.Record]:
+    """
+    Return every active site joined with its open hold (if any) in one query.
+    Hold columns are prefixed `hold_` and are NULL for sites with no open hold.
+    """
+    async with pool.acquire() as conn:
+        return await conn.fetch(
+            """
+            SELECT s.*,
+                   h.id                 AS hold_id,
+                   h.trigger_rule       AS hold_trigger_rule,
+                   h.triggered_at       AS hold_triggered_at,
+                   h.hold_duration_mins AS hold_duration_mins,
+                   h.vehicles_on_site   AS hold_vehicles_on_site
+            FROM sites s
+            LEFT JOIN LATERAL (
+              SELECT id, trigger_rule, triggered_at, hold_duration_mins, vehicles_on_site
+              FROM holds_log
+              WHERE site_id = s.id AND all_clear_at IS NULL
+              ORDER BY triggered_at DESC
+              LIMIT 1
+            ) h ON true
+            WHERE s.active = true
+            """
+        )
+
+
+def _serialize_value(v):
+    if isinstance(v, datetime):
+        return v.isoformat()
+    if isinstance(v, uuid.UUID):
+        return str(v)
+    return v
+
+
 def serialize_row(row) -> dict | None:
     """Convert an asyncpg Record to a JSON-serialisable dict."""
     if row is None:
         return None
-    d = dict(row)
-    for k, v in d.items():
-        if isinstance(v, uuid.UUID):
-            d[k] = str(v)
-        elif isinstance(v, datetime):
-            d[k] = v.isoformat()
-    return d
+    return {k: _serialize_value(v) for k, v in row.items()}
 
 
 def serialize_rows(rows) -> list[dict]:
-    return [serialize_row(r) for r in rows]
+    return list(map(serialize_row, rows))
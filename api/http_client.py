@@ -0,0 +1,12 @@
+"""Shared httpx client construction for the Geotab API."""
+
+import httpx
+
+
+def make_geotab_client(timeout: float) -> httpx.AsyncClient:
+    """Build a Geotab API client. Auth and polling both use this so they stay configured alike."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
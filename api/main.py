@@ -4,11 +4,13 @@ from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import Depends, FastAPI, Request
+from fastapi import BackgroundTasks, Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from auth.dependencies import get_current_user
+from auth.geotab import close_client as close_auth_client
 from database import create_pool, close_pool
+from polling.geotab import close_client as close_geotab_client
 from polling.scheduler import start_scheduler, shutdown_scheduler, poll
 from routes import sites, holds, logs
 
@@ -27,24 +29,32 @@ async def lifespan(app: FastAPI):
     yield
 
     # ── Shutdown ──────────────────────────────────────────────────────────────
-    shutdown_scheduler()
+    await shutdown_scheduler()
+    await close_geotab_client()
+    await close_auth_client()
     await close_pool(app.state.pool)
 
 
 app = FastAPI(title="ClearSkies API", version="1.0.0", lifespan=lifespan)
 
+# Explicit lists — wildcards make Starlette reflect request headers on every preflight
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
+    allow_origins=frozenset({
         "https://my.geotab.com",
         "https://reubenfrith.github.io",
         "http://localhost:5173",
         "http://localhost:3000",
         "http://localhost:4173",
-    ],
+    }),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=[
+        "Content-Type",
+        "X-Geotab-User",
+        "X-Geotab-Session",
+        "X-Geotab-Database",
+    ],
 )
 
 _auth = [Depends(get_current_user)]
@@ -59,7 +69,7 @@ async def health():
 
 
 @app.post("/api/poll", dependencies=[Depends(get_current_user)])
-async def trigger_poll(request: Request):
-    """Manually trigger an immediate poll cycle for all sites."""
-    await poll(request.app.state.pool)
-    return {"status": "ok"}
+async def trigger_poll(request: Request, background_tasks: BackgroundTasks):
+    """Schedule an immediate poll cycle for all sites and return without waiting."""
+    background_tasks.add_task(poll, request.app.state.pool)
+    return {"status": "scheduled"}
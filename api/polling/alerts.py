@@ -1,14 +1,35 @@
 """Geotab TextMessage alerts — replaces Twilio SMS."""
 
+import asyncio
+import functools
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 from polling.geotab import _geotab_call, _get_session
 from polling.thresholds import RULE_LABELS
 
 logger = logging.getLogger(__name__)
 
+# Max TextMessage sends in flight at once for a single alert batch
+_SEND_CONCURRENCY = 16
+
+# Message templates — bound per batch with functools.partial, so only
+# `vehicle` is filled in per send
+_HOLD_TMPL = (
+    "\u26a0\ufe0f WORK HOLD \u2014 {site}\n"
+    "Reason: {reason}\n"
+    "{duration}\n"
+    "Vehicle: {vehicle}\n"
+    "Issued by ClearSkies at {now} UTC"
+).format
+_ALL_CLEAR_TMPL = (
+    "\u2705 ALL CLEAR \u2014 {site}\n"
+    "{reason} conditions have passed.\n"
+    "Work may resume. Please confirm with your site supervisor.\n"
+    "Vehicle: {vehicle}"
+).format
+
 
 async def send_geotab_message(device_id: str, message: str) -> str:
     """Send a TextMessage to a device via the Geotab API; returns the new message id."""
@@ -34,25 +55,99 @@ async def send_geotab_message(device_id: str, message: str) -> str:
     return str(result)
 
 
-async def _log_notification(pool, data: dict) -> None:
-    async with pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO notification_log
-              (hold_id, driver_name, phone_number, geotab_device_id, message_type,
-               sent_at, status, geotab_message_id, message_body)
-            VALUES ($1::uuid, $2, $3, $4, $5, $6, $7, $8, $9)
-            """,
-            data.get("hold_id"),
-            data.get("driver_name"),
-            data.get("phone_number"),
-            data.get("geotab_device_id"),
-            data["message_type"],
-            data["sent_at"],
-            data.get("status"),
-            data.get("geotab_message_id"),
-            data.get("message_body"),
-        )
+async def send_geotab_messages(messages: list[tuple[str, str]]) -> list:
+    """
+    Send (device_id, message) pairs with at most _SEND_CONCURRENCY in flight.
+    Returns, in order, each new message id or the exception that send raised.
+    """
+    sem = asyncio.Semaphore(_SEND_CONCURRENCY)
+
+    async def _one(device_id: str, message: str) -> str:
+        async with sem:
+            return await send_geotab_message(device_id, message)
+
+    return await asyncio.gather(*[_one(d, m) for d, m in messages], return_exceptions=True)
+
+
+async def _log_notifications(conn, hold_id: str, sent_at: datetime, records: list[dict]) -> None:
+    """Insert one notification_log row per record in a single batch."""
+    if not records:
+        return
+    await conn.executemany(
+        """
+        INSERT INTO notification_log
+          (hold_id, driver_name, phone_number, geotab_device_id, message_type,
+           sent_at, status, geotab_message_id, message_body)
+        VALUES ($1::uuid, $2, $3, $4, $5, $6, $7, $8, $9)
+        """,
+        [
+            (
+                hold_id,
+                rec.get("driver_name"),
+                rec.get("phone_number"),
+                rec.get("geotab_device_id"),
+                rec["message_type"],
+                sent_at,
+                rec.get("status"),
+                rec.get("geotab_message_id"),
+                rec.get("message_body"),
+            )
+            for rec in records
+        ],
+    )
+
+
+async def _send_to_vehicles(
+    pool,
+    hold_id: str,
+    vehicles: list,
+    message_type: str,
+    label: str,
+    render_body: Callable[..., str],
+    sent_at: datetime,
+) -> list[dict]:
+    """
+    Send a TextMessage to each vehicle concurrently, then log all sends in one batch.
+    The sends hold no pool connection; one is checked out only for the insert.
+    """
+    sent_at_iso = sent_at.isoformat()  # one dispatch — every record shares the timestamp
+    bodies = [render_body(vehicle=v["device_name"]) for v in vehicles]
+    outcomes = await send_geotab_messages([(v["device_id"], b) for v, b in zip(vehicles, bodies)])
+
+    results = []
+    for v, body, outcome in zip(vehicles, bodies, outcomes):
+        if isinstance(outcome, Exception):
+            msg_id = None
+            status = f"failed: {outcome}"
+            logger.error(f"[Alert] Failed to send {label.lower()} to device {v['device_id']}: {outcome}")
+        else:
+            msg_id = outcome
+            status = "sent"
+            logger.info(
+                f"[Alert] {label} sent to {v.get('driver_name') or v['device_name']} "
+                f"(device {v['device_id']}) \u2014 msg {msg_id}"
+            )
+        results.append({
+            "driver_name": v.get("driver_name"),
+            "phone_number": v.get("phone_number"),
+            "geotab_device_id": v["device_id"],
+            "message_type": message_type,
+            "sent_at": sent_at_iso,
+            "status": status,
+            "geotab_message_id": msg_id,
+            "message_body": body,
+        })
+
+    if not results:
+        return results  # no vehicles on site — nothing to log, so no pool checkout
+
+    try:
+        async with pool.acquire() as conn:
+            await _log_notifications(conn, hold_id, sent_at, results)
+    except Exception as db_err:
+        # Messages are already out — don't let a logging failure lose the results
+        logger.error(f"[Alert] Failed to log {len(results)} notification(s) for hold {hold_id}: {db_err}")
+    return results
 
 
 async def send_hold_alerts(
@@ -69,50 +164,33 @@ async def send_hold_alerts(
         if hold_duration_mins is not None
         else "Work must stop until conditions improve."
     )
-    now_et = datetime.now(timezone.utc).strftime("%-I:%M %p")
+    now = datetime.now(timezone.utc)
+    now_et = now.strftime("%-I:%M %p")
 
-    results: list[dict] = []
+    targets = []
     for v in vehicles:
         if not v.get("device_id"):
             logger.warning(
                 f"[Alert] No device_id for {v.get('driver_name') or v.get('device_name')} — skipping"
             )
             continue
-
-        body = (
-            f"\u26a0\ufe0f WORK HOLD \u2014 {site_name}\n"
-            f"Reason: {RULE_LABELS.get(rule, rule)}\n"
-            f"{duration_text}\n"
-            f"Vehicle: {v['device_name']}\n"
-            f"Issued by ClearSkies at {now_et} UTC"
-        )
-
-        try:
-            msg_id = await send_geotab_message(v["device_id"], body)
-            status = "sent"
-            logger.info(
-                f"[Alert] Hold sent to {v.get('driver_name') or v['device_name']} "
-                f"(device {v['device_id']}) \u2014 msg {msg_id}"
-            )
-        except Exception as err:
-            msg_id = None
-            status = f"failed: {err}"
-            logger.error(f"[Alert] Failed to send hold to device {v['device_id']}: {err}")
-
-        rec = {
-            "driver_name": v.get("driver_name"),
-            "phone_number": v.get("phone_number"),
-            "geotab_device_id": v["device_id"],
-            "message_type": "hold",
-            "sent_at": datetime.now(timezone.utc).isoformat(),
-            "status": status,
-            "geotab_message_id": msg_id,
-            "message_body": body,
-        }
-        await _log_notification(pool, {"hold_id": hold_id, **rec})
-        results.append(rec)
-
-    return results
+        targets.append(v)
+
+    return await _send_to_vehicles(
+        pool,
+        hold_id,
+        targets,
+        "hold",
+        "Hold",
+        functools.partial(
+            _HOLD_TMPL,
+            site=site_name,
+            reason=RULE_LABELS.get(rule, rule),
+            duration=duration_text,
+            now=now_et,
+        ),
+        now,
+    )
 
 
 async def send_all_clear_alerts(
@@ -123,41 +201,12 @@ async def send_all_clear_alerts(
     vehicles: list,
 ) -> list[dict]:
     """Send all-clear TextMessage to all vehicles that were on site; log each."""
-    results: list[dict] = []
-    for v in vehicles:
-        if not v.get("device_id"):
-            continue
-
-        body = (
-            f"\u2705 ALL CLEAR \u2014 {site_name}\n"
-            f"{RULE_LABELS.get(rule, rule)} conditions have passed.\n"
-            f"Work may resume. Please confirm with your site supervisor.\n"
-            f"Vehicle: {v['device_name']}"
-        )
-
-        try:
-            msg_id = await send_geotab_message(v["device_id"], body)
-            status = "sent"
-            logger.info(
-                f"[Alert] All-clear sent to {v.get('driver_name') or v['device_name']} "
-                f"(device {v['device_id']}) \u2014 msg {msg_id}"
-            )
-        except Exception as err:
-            msg_id = None
-            status = f"failed: {err}"
-            logger.error(f"[Alert] Failed to send all-clear to device {v['device_id']}: {err}")
-
-        rec = {
-            "driver_name": v.get("driver_name"),
-            "phone_number": v.get("phone_number"),
-            "geotab_device_id": v["device_id"],
-            "message_type": "all_clear",
-            "sent_at": datetime.now(timezone.utc).isoformat(),
-            "status": status,
-            "geotab_message_id": msg_id,
-            "message_body": body,
-        }
-        await _log_notification(pool, {"hold_id": hold_id, **rec})
-        results.append(rec)
-
-    return results
+    return await _send_to_vehicles(
+        pool,
+        hold_id,
+        [v for v in vehicles if v.get("device_id")],
+        "all_clear",
+        "All-clear",
+        functools.partial(_ALL_CLEAR_TMPL, site=site_name, reason=RULE_LABELS.get(rule, rule)),
+        datetime.now(timezone.utc),
+    )
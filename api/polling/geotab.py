@@ -1,16 +1,46 @@
 """Port of agent/src/geotabResolver.ts — Geotab authentication and zone lookup."""
 
+import asyncio
 import os
 import logging
+import re
 from typing import Optional
 
 import httpx
+import orjson
+from cachetools import TTLCache
+
+from http_client import make_geotab_client
 
 logger = logging.getLogger(__name__)
 
 # Module-level session cache (same pattern as the TypeScript version)
 _session: Optional[dict] = None
 
+# Serialises Authenticate so concurrent callers share a single login
+_auth_lock = asyncio.Lock()
+
+# driver_id → normalised phone (None if the user has no phone on file).
+# Drivers rarely change numbers, so this is reused across poll cycles.
+_phone_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
+
+# Shared client — every Geotab call is multiplexed over pooled HTTP/2 connections
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = make_geotab_client(timeout=15.0)
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def _geotab_call(server: str, method: str, params: dict, credentials: Optional[dict] = None) -> object:
     url = f"https://{server}/apiv1"
@@ -19,10 +49,13 @@ async def _geotab_call(server: str, method: str, params: dict, credentials: Opti
         "params": {**params, "credentials": credentials} if credentials else params,
         "id": 1,
     }
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        resp = await client.post(url, json=body)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await _get_client().post(
+        url,
+        content=orjson.dumps(body),
+        headers={"content-type": "application/json"},
+    )
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
 
     if "error" in data:
         raise RuntimeError(f"Geotab API error [{method}]: {data['error']}")
@@ -63,15 +96,30 @@ async def authenticate() -> dict:
 
 
 async def _get_session() -> dict:
+    if _session:
+        return _session
+    async with _auth_lock:
+        if not _session:
+            return await authenticate()
+        return _session
+
+
+async def _reauthenticate(stale: dict) -> dict:
+    """Replace an expired session, unless another task already has."""
     global _session
-    if not _session:
-        return await authenticate()
-    return _session
+    async with _auth_lock:
+        if _session is stale or not _session:
+            _session = None
+            return await authenticate()
+        return _session
+
+
+_NON_DIGITS = re.compile(r"\D")
 
 
 def _normalize_phone(raw: str) -> str:
     """Strip non-digits and return E.164 format for Twilio."""
-    digits = "".join(c for c in raw if c.isdigit())
+    digits = _NON_DIGITS.sub("", raw)
     if digits.startswith("1") and len(digits) == 11:
         return f"+{digits}"
     if len(digits) == 10:
@@ -84,33 +132,52 @@ async def _resolve_driver_phones(session: dict, driver_ids: list[str]) -> dict[s
     if not driver_ids:
         return {}
 
+    phone_map: dict[str, str] = {}
+    missing: list[str] = []
+    for driver_id in driver_ids:
+        if driver_id in _phone_cache:
+            if _phone_cache[driver_id]:
+                phone_map[driver_id] = _phone_cache[driver_id]
+        else:
+            missing.append(driver_id)
+
+    if not missing:
+        return phone_map
+
     creds = {
         "database": session["database"],
         "userName": session["userName"],
         "sessionId": session["sessionId"],
     }
+    calls = [
+        {"method": "Get", "params": {"typeName": "User", "search": {"id": driver_id}}}
+        for driver_id in missing
+    ]
 
-    phone_map: dict[str, str] = {}
-    for driver_id in driver_ids:
-        try:
-            users = await _geotab_call(
-                session["server"],
-                "Get",
-                {"typeName": "User", "search": {"id": driver_id}},
-                creds,
-            )
-            if users and users[0].get("phoneNumber"):
-                phone_map[driver_id] = _normalize_phone(users[0]["phoneNumber"])
-        except Exception:
-            pass  # Non-fatal: we'll skip unreachable drivers
+    try:
+        # One round trip for all drivers — results are returned in call order
+        results = await _geotab_call(session["server"], "ExecuteMultiCall", {"calls": calls}, creds)
+    except Exception as err:
+        # One bad call fails the whole batch; fall back to parallel single lookups
+        logger.warning(f"[Geotab] Driver multi-call failed, retrying individually: {err}")
+        results = await asyncio.gather(
+            *[_geotab_call(session["server"], c["method"], c["params"], creds) for c in calls],
+            return_exceptions=True,
+        )
+
+    for driver_id, users in zip(missing, results):
+        if isinstance(users, Exception):
+            continue  # Non-fatal: we'll skip unreachable drivers
+        phone = _normalize_phone(users[0]["phoneNumber"]) if users and users[0].get("phoneNumber") else None
+        _phone_cache[driver_id] = phone
+        if phone:
+            phone_map[driver_id] = phone
 
     return phone_map
 
 
 async def get_vehicles_in_zone(zone_id: str) -> list[dict]:
     """Return all communicating vehicles currently inside the given Geotab zone."""
-    global _session
-
     session = await _get_session()
     creds = {
         "database": session["database"],
@@ -129,8 +196,7 @@ async def get_vehicles_in_zone(zone_id: str) -> list[dict]:
         # Re-authenticate once on session expiry
         err_str = str(err)
         if "InvalidUserException" in err_str or "DbUnavailableException" in err_str:
-            _session = None
-            session = await authenticate()
+            session = await _reauthenticate(session)
             creds = {
                 "database": session["database"],
                 "userName": session["userName"],
@@ -6,14 +6,16 @@ Also fires an immediate poll on startup.
 """
 
 import asyncio
-import json
 import logging
 import os
+import time
 from datetime import datetime, timezone
 
+import orjson
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from polling.weather import fetch_weather
+from database import fetch_sites_with_state
+from polling.weather import fetch_weather, init_client as init_weather_client, close_client as close_weather_client
 from polling.thresholds import evaluate_thresholds, should_clear_hold
 from polling.geotab import get_vehicles_in_zone, authenticate
 from polling.alerts import send_hold_alerts, send_all_clear_alerts
@@ -22,113 +24,110 @@ logger = logging.getLogger(__name__)
 
 _scheduler: AsyncIOScheduler | None = None
 
+POLL_INTERVAL_MINUTES = int(os.environ.get("POLL_INTERVAL_MINUTES", "5"))
+
+# Sites processed at once. Pool connections are only held for individual
+# writes, never across weather or Geotab calls, so this is bounded by
+# Open-Meteo's rate limit rather than PG_POOL_MAX
+_SITE_SEM = asyncio.Semaphore(int(os.environ.get("POLL_CONCURRENCY", "16")))
+
+# Held for the duration of a poll cycle — overlapping triggers are dropped
+_poll_lock = asyncio.Lock()
+
 
 # ─── Database helpers ─────────────────────────────────────────────────────────
 
-async def _get_active_sites(pool) -> list[dict]:
-    async with pool.acquire() as conn:
-        rows = await conn.fetch("SELECT * FROM sites WHERE active = true")
-        return [dict(r) for r in rows]
-
-
-async def _get_active_hold(pool, site_id: str) -> dict | None:
-    async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT * FROM holds_log
-            WHERE site_id = $1::uuid AND all_clear_at IS NULL
-            ORDER BY triggered_at DESC
-            LIMIT 1
-            """,
-            site_id,
-        )
-        return dict(row) if row else None
-
-
-async def _create_hold(pool, data: dict) -> dict:
-    async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            """
-            INSERT INTO holds_log
-              (site_id, triggered_at, trigger_rule, weather_snapshot, vehicles_on_site, hold_duration_mins, issued_by)
-            VALUES ($1::uuid, now(), $2, $3::jsonb, $4::jsonb, $5, 'auto')
-            RETURNING *
-            """,
-            data["site_id"],
-            data["trigger_rule"],
-            json.dumps(data["weather_snapshot"]),
-            json.dumps(data["vehicles_on_site"]),
-            data.get("hold_duration_mins"),
-        )
-        return dict(row)
+def _split_site_row(row) -> tuple[dict, dict | None]:
+    """Split a fetch_sites_with_state row into (site, open hold or None)."""
+    site = dict(row)
+    hold = {
+        "id": site.pop("hold_id"),
+        "trigger_rule": site.pop("hold_trigger_rule"),
+        "triggered_at": site.pop("hold_triggered_at"),
+        "hold_duration_mins": site.pop("hold_duration_mins"),
+        "vehicles_on_site": site.pop("hold_vehicles_on_site"),
+    }
+    # Holds opened before the jsonb codec fix store vehicles as a JSON string. Remove
+    # once the schema.sql unwrap migration has been applied everywhere
+    if isinstance(hold["vehicles_on_site"], str):
+        hold["vehicles_on_site"] = orjson.loads(hold["vehicles_on_site"])
+    return site, hold if hold["id"] is not None else None
+
+
+async def _create_hold(conn, data: dict) -> dict:
+    row = await conn.fetchrow(
+        """
+        INSERT INTO holds_log
+          (site_id, triggered_at, trigger_rule, weather_snapshot, vehicles_on_site, hold_duration_mins, issued_by)
+        VALUES ($1::uuid, now(), $2, $3, $4, $5, 'auto')
+        RETURNING *
+        """,
+        data["site_id"],
+        data["trigger_rule"],
+        data["weather_snapshot"],
+        data["vehicles_on_site"],
+        data.get("hold_duration_mins"),
+    )
+    return dict(row)
 
 
-async def _close_hold(pool, hold_id: str, notifications: list) -> None:
+async def _close_hold(conn, hold_id: str, notifications: list) -> None:
     import uuid as _uuid
     hold_uuid = hold_id if isinstance(hold_id, _uuid.UUID) else str(hold_id)
-    async with pool.acquire() as conn:
-        await conn.execute(
-            """
-            UPDATE holds_log
-            SET all_clear_at = now(), notifications_sent = $2::jsonb
-            WHERE id = $1::uuid
-            """,
-            hold_uuid,
-            json.dumps(notifications),
-        )
+    await conn.execute(
+        """
+        UPDATE holds_log
+        SET all_clear_at = now(), notifications_sent = $2
+        WHERE id = $1::uuid
+        """,
+        hold_uuid,
+        notifications,
+    )
 
 
 # ─── Site processing ──────────────────────────────────────────────────────────
 
-async def _process_site(pool, site: dict) -> None:
+async def _process_site(pool, site: dict, active_hold_map: dict[str, dict]) -> None:
     site_id = str(site["id"])
     site_name = site["name"]
     zone_id = site["geotab_zone_id"]
+    active_hold = active_hold_map.get(site_id)
 
-    # Fetch weather and active hold concurrently
-    weather_result, hold_result = await asyncio.gather(
-        fetch_weather(site),
-        _get_active_hold(pool, site_id),
-        return_exceptions=True,
-    )
-
-    if isinstance(weather_result, Exception):
-        logger.warning(f"[{site_name}] Weather fetch failed — skipping: {weather_result}")
-        return
-
-    weather = weather_result
-    active_hold = None if isinstance(hold_result, Exception) else hold_result
+    # Timed holds clear on elapsed time alone, so skip the Open-Meteo call for them
+    if active_hold and active_hold.get("hold_duration_mins") is not None:
+        weather = None
+    else:
+        try:
+            weather = await fetch_weather(site)
+        except Exception as err:
+            logger.warning(f"[{site_name}] Weather fetch failed — skipping: {err}")
+            return
 
-    breach = evaluate_thresholds(weather)
+    breach = None if active_hold else evaluate_thresholds(weather)
 
     if active_hold:
         # ── Active hold: check if we should issue all-clear ───────────────────
-        triggered_at = active_hold["triggered_at"]
-        if isinstance(triggered_at, str):
-            triggered_at = datetime.fromisoformat(triggered_at)
-
         hold_id = str(active_hold["id"])
         clear = should_clear_hold(
             active_hold["trigger_rule"],
             weather,
-            triggered_at,
+            active_hold["triggered_at"],
             active_hold.get("hold_duration_mins"),
         )
 
         if clear:
             logger.info(f"[{site_name}] Conditions cleared — issuing all-clear for hold {hold_id}")
-            vehicles = active_hold["vehicles_on_site"]
-            if isinstance(vehicles, str):
-                vehicles = json.loads(vehicles)
-
+            # Geotab sends run with no pool connection held; each write below
+            # checks one out only for its own statement
             notifications = await send_all_clear_alerts(
                 pool=pool,
                 hold_id=hold_id,
                 site_name=site_name,
                 rule=active_hold["trigger_rule"],
-                vehicles=vehicles,
+                vehicles=active_hold["vehicles_on_site"],
             )
-            await _close_hold(pool, hold_id, notifications)
+            async with pool.acquire() as conn:
+                await _close_hold(conn, hold_id, notifications)
             logger.info(f"[{site_name}] All-clear issued to {len(notifications)} driver(s)")
         else:
             logger.info(f"[{site_name}] Hold active since {active_hold['triggered_at']} — no change")
@@ -143,13 +142,14 @@ async def _process_site(pool, site: dict) -> None:
         vehicles = await get_vehicles_in_zone(zone_id)
         logger.info(f"[{site_name}] {len(vehicles)} vehicle(s) on site")
 
-        hold = await _create_hold(pool, {
-            "site_id": site_id,
-            "trigger_rule": breach["rule"],
-            "weather_snapshot": weather,
-            "vehicles_on_site": vehicles,
-            "hold_duration_mins": breach.get("hold_duration_mins"),
-        })
+        async with pool.acquire() as conn:
+            hold = await _create_hold(conn, {
+                "site_id": site_id,
+                "trigger_rule": breach["rule"],
+                "weather_snapshot": weather,
+                "vehicles_on_site": vehicles,
+                "hold_duration_mins": breach.get("hold_duration_mins"),
+            })
 
         hold_id = str(hold["id"])
         notifications = await send_hold_alerts(
@@ -172,18 +172,51 @@ async def _process_site(pool, site: dict) -> None:
 
 
 async def poll(pool) -> None:
+    if _poll_lock.locked():
+        logger.info("[ClearSkies] Poll already in progress — skipping")
+        return
+    async with _poll_lock:
+        t0 = time.monotonic()
+        await _run_poll(pool)
+        elapsed = time.monotonic() - t0
+
+    budget = POLL_INTERVAL_MINUTES * 60
+    if elapsed > budget * 0.8:
+        logger.warning(
+            f"[ClearSkies] Poll took {elapsed:.1f}s — over 80% of the {budget}s interval; "
+            "the next run may be skipped"
+        )
+    else:
+        logger.info(f"[ClearSkies] Poll took {elapsed:.1f}s")
+
+
+async def _run_poll(pool) -> None:
     logger.info(f"\n[ClearSkies] Poll started at {datetime.now(timezone.utc).isoformat()}")
 
     try:
-        sites = await _get_active_sites(pool)
+        # Sites and their open holds in one round trip; if it fails there is no
+        # hold state, and every site would look unheld and re-trigger — skip the cycle
+        rows = await fetch_sites_with_state(pool)
     except Exception as err:
         logger.error(f"[ClearSkies] Failed to fetch sites: {err}")
         return
 
+    sites: list[dict] = []
+    active_hold_map: dict[str, dict] = {}
+    for row in rows:
+        site, hold = _split_site_row(row)
+        sites.append(site)
+        if hold:
+            active_hold_map[str(site["id"])] = hold
+
     logger.info(f"[ClearSkies] Monitoring {len(sites)} active site(s)")
 
-    # Process all sites concurrently — failures on one don't block others
-    tasks = [_process_site(pool, site) for site in sites]
+    async def _guarded(site: dict) -> None:
+        async with _SITE_SEM:
+            await _process_site(pool, site, active_hold_map)
+
+    # Process sites concurrently (bounded) — failures on one don't block others
+    tasks = [_guarded(site) for site in sites]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     for site, result in zip(sites, results):
@@ -198,13 +231,15 @@ async def poll(pool) -> None:
 async def start_scheduler(pool) -> None:
     global _scheduler
 
-    interval = int(os.environ.get("POLL_INTERVAL_MINUTES", "5"))
+    interval = POLL_INTERVAL_MINUTES
     demo = os.environ.get("DEMO_MODE") == "true"
 
     logger.info("🌤  ClearSkies monitoring agent starting...")
     logger.info(f"   Poll interval: {interval} min")
     logger.info(f"   Demo mode: {'ON' if demo else 'off'}")
 
+    init_weather_client()
+
     # Authenticate with Geotab upfront so the first poll is fast
     try:
         await authenticate()
@@ -219,6 +254,12 @@ async def start_scheduler(pool) -> None:
         minutes=interval,
         args=[pool],
         id="poll",
+        # A run that comes due while the previous poll is still going is skipped
+        # (APScheduler logs a warning) rather than stacked on top; runs missed
+        # while the scheduler was blocked collapse into a single catch-up run
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=interval * 60,
     )
     _scheduler.start()
     logger.info(f"[ClearSkies] Scheduler started — polling every {interval} min")
@@ -227,9 +268,10 @@ async def start_scheduler(pool) -> None:
     await poll(pool)
 
 
-def shutdown_scheduler() -> None:
+async def shutdown_scheduler() -> None:
     global _scheduler
     if _scheduler:
         _scheduler.shutdown()
         _scheduler = None
         logger.info("[ClearSkies] Scheduler stopped")
+    await close_weather_client()
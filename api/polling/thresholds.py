@@ -34,8 +34,8 @@ RULE_LABELS = {
 }
 
 
-def _get_thresholds() -> dict:
-    return DEMO_THRESHOLDS if os.environ.get("DEMO_MODE") == "true" else PROD_THRESHOLDS
+# DEMO_MODE is fixed for the life of the process — resolve it once at import
+_THRESHOLDS = DEMO_THRESHOLDS if os.environ.get("DEMO_MODE") == "true" else PROD_THRESHOLDS
 
 
 def evaluate_thresholds(weather: dict) -> dict | None:
@@ -43,56 +43,57 @@ def evaluate_thresholds(weather: dict) -> dict | None:
     Evaluate a weather snapshot against OSHA thresholds.
     Returns the highest-priority breach dict, or None if all clear.
     """
-    t = _get_thresholds()
-    breaches: list[dict] = []
+    t = _THRESHOLDS
 
-    if weather["lightning_probability_pct"] >= t["lightning_pct"]:
-        breaches.append({
+    # Checked in RULE_PRIORITY order — the first breach wins
+    lightning = weather["lightning_probability_pct"]
+    if lightning >= t["lightning_pct"]:
+        return {
             "rule": "LIGHTNING_30_30",
-            "value": weather["lightning_probability_pct"],
+            "value": lightning,
             "threshold": t["lightning_pct"],
             "hold_duration_mins": 30,
-        })
+        }
 
     # Use gust speed — gusts cause structural risk
-    if weather["wind_gust_mph"] >= t["high_wind_general_mph"]:
-        breaches.append({
+    gust = weather["wind_gust_mph"]
+    if gust >= t["high_wind_general_mph"]:
+        return {
             "rule": "HIGH_WIND_GENERAL",
-            "value": weather["wind_gust_mph"],
+            "value": gust,
             "threshold": t["high_wind_general_mph"],
             "hold_duration_mins": None,
-        })
-    elif weather["wind_gust_mph"] >= t["high_wind_material_mph"]:
-        breaches.append({
+        }
+    if gust >= t["high_wind_material_mph"]:
+        return {
             "rule": "HIGH_WIND_MATERIAL_HANDLING",
-            "value": weather["wind_gust_mph"],
+            "value": gust,
             "threshold": t["high_wind_material_mph"],
             "hold_duration_mins": None,
-        })
+        }
 
-    if weather["apparent_temp_c"] >= t["extreme_heat_c"]:
-        breaches.append({
+    heat = weather["apparent_temp_c"]
+    if heat >= t["extreme_heat_c"]:
+        return {
             "rule": "EXTREME_HEAT",
-            "value": weather["apparent_temp_c"],
+            "value": heat,
             "threshold": t["extreme_heat_c"],
             "hold_duration_mins": None,
-        })
+        }
 
-    if not breaches:
-        return None
-
-    # Return highest-priority breach
-    breaches.sort(key=lambda b: RULE_PRIORITY.index(b["rule"]))
-    return breaches[0]
+    return None
 
 
 def should_clear_hold(
     rule: str,
-    weather: dict,
+    weather: dict | None,
     triggered_at: datetime,
     hold_duration_mins: int | None,
 ) -> bool:
-    """Check whether an active hold should be cleared based on current weather."""
+    """
+    Check whether an active hold should be cleared based on current weather.
+    Timed holds depend only on elapsed time, so `weather` may be None for them.
+    """
     # Timed hold: clear after duration elapses
     if hold_duration_mins is not None:
         # Ensure triggered_at is timezone-aware
@@ -102,7 +103,7 @@ def should_clear_hold(
         return elapsed_secs >= hold_duration_mins * 60
 
     # Condition-based hold: clear when weather drops below threshold
-    t = _get_thresholds()
+    t = _THRESHOLDS
     if rule == "HIGH_WIND_GENERAL":
         return weather["wind_gust_mph"] < t["high_wind_general_mph"]
     if rule == "HIGH_WIND_MATERIAL_HANDLING":
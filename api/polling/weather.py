@@ -1,19 +1,45 @@
 """Port of agent/src/weatherPoller.ts — Open-Meteo weather fetching."""
 
+import os
+from array import array
+from typing import Optional
+
 import httpx
 
 # Open-Meteo free API — no key required
 BASE_URL = "https://api.open-meteo.com/v1/forecast"
 
+# Shared client — every site's fetch in a poll is multiplexed over one HTTP/2 connection
+_client: Optional[httpx.AsyncClient] = None
+
 # WMO weather codes that indicate active thunderstorm (lightning fallback)
 THUNDERSTORM_CODES = {95, 96, 99}
 
+# Query parameters shared by every site — only latitude/longitude vary
+_BASE_PARAMS = {
+    "current": ",".join([
+        "temperature_2m",
+        "apparent_temperature",
+        "wind_speed_10m",
+        "wind_gusts_10m",
+        "weather_code",
+        "precipitation",
+    ]),
+    "hourly": "lightning_potential",
+    "forecast_hours": 1,
+    "wind_speed_unit": "ms",
+    "timezone": "auto",
+}
+
+# Keep the full Open-Meteo response in the snapshot (debugging only — it bloats holds_log)
+STORE_RAW = os.environ.get("WEATHER_STORE_RAW") == "true"
+
 
 def _mps_to_mph(mps: float) -> float:
     return mps * 2.23694
 
 
-def _cape_to_probability(cape: float) -> int:
+def _cape_to_probability_exact(cape: float) -> int:
     """Convert CAPE (J/kg) to a lightning probability bucket (0–90%)."""
     if cape < 100:
         return round((cape / 100) * 10)
@@ -24,30 +50,47 @@ def _cape_to_probability(cape: float) -> int:
     return min(90, round(60 + ((cape - 1500) / 2000) * 30))
 
 
+# Probability saturates at 90% from 3500 J/kg, so one byte per whole J/kg up to there
+_CAPE_MAX = 3500
+_CAPE_TABLE = array("B", [_cape_to_probability_exact(i) for i in range(_CAPE_MAX + 1)])
+
+
+def _cape_to_probability(cape: float) -> int:
+    """
+    Table lookup of _cape_to_probability_exact at the nearest whole J/kg (within ±1%).
+    Rounds rather than truncates so values just past a step aren't biased low.
+    """
+    return _CAPE_TABLE[max(0, min(round(cape), _CAPE_MAX))]
+
+
+def init_client() -> None:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 async def fetch_weather(site: dict) -> dict:
     """Fetch current weather for a site and return a WeatherSnapshot dict."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(
-            BASE_URL,
-            params={
-                "latitude": site["lat"],
-                "longitude": site["lng"],
-                "current": ",".join([
-                    "temperature_2m",
-                    "apparent_temperature",
-                    "wind_speed_10m",
-                    "wind_gusts_10m",
-                    "weather_code",
-                    "precipitation",
-                ]),
-                "hourly": "lightning_potential",
-                "forecast_hours": 1,
-                "wind_speed_unit": "ms",
-                "timezone": "auto",
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    if _client is None:
+        raise RuntimeError("Weather client not initialised — call init_client() first")
+
+    resp = await _client.get(
+        BASE_URL,
+        params={**_BASE_PARAMS, "latitude": site["lat"], "longitude": site["lng"]},
+    )
+    resp.raise_for_status()
+    data = resp.json()
 
     c = data["current"]
 
@@ -57,7 +100,7 @@ async def fetch_weather(site: dict) -> dict:
     if lightning_pct < 40 and c["weather_code"] in THUNDERSTORM_CODES:
         lightning_pct = 50  # active thunderstorm confirmed by WMO code
 
-    return {
+    snapshot = {
         "timestamp": c["time"],
         "wind_speed_mph": round(_mps_to_mph(c["wind_speed_10m"]) * 10) / 10,
         "wind_gust_mph": round(_mps_to_mph(c["wind_gusts_10m"]) * 10) / 10,
@@ -65,5 +108,7 @@ async def fetch_weather(site: dict) -> dict:
         "lightning_probability_pct": lightning_pct,
         "weather_code": c["weather_code"],
         "precipitation_mm": round(c["precipitation"] * 10) / 10,
-        "raw": data,
     }
+    if STORE_RAW:
+        snapshot["raw"] = data
+    return snapshot
@@ -1,6 +1,8 @@
 import json
+from datetime import datetime
 from typing import Optional
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
@@ -8,6 +10,11 @@ from database import get_pool, serialize_row, serialize_rows
 
 router = APIRouter()
 
+# COUNT(*) scans the whole table — share one result across page clicks. Holds
+# are also opened by the scheduler, so the total is left to expire rather than
+# invalidated on write: it may lag new holds by up to 30s.
+_total_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+
 
 class CreateHoldRequest(BaseModel):
     site_id: str
@@ -47,29 +54,72 @@ async def list_active_holds(
     return serialize_rows(rows)
 
 
+# weather_snapshot is only rendered for active holds — leave it out of history pages
+_HISTORY_COLUMNS = """
+    h.id, h.site_id, h.triggered_at, h.trigger_rule, h.vehicles_on_site,
+    h.hold_duration_mins, h.all_clear_at, h.issued_by, h.notifications_sent,
+    s.name as site_name
+"""
+
+
 @router.get("/holds")
 async def list_holds(
     page: int = Query(0, ge=0),
     page_size: int = Query(25, ge=1, le=500),
+    before_triggered_at: Optional[datetime] = Query(None),
+    before_id: Optional[str] = Query(None),
     pool=Depends(get_pool),
 ):
-    """Return paginated hold history (all holds, closed and open), joined with site name."""
-    offset = page * page_size
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT h.*, s.name as site_name
-            FROM holds_log h
-            JOIN sites s ON h.site_id = s.id
-            ORDER BY h.triggered_at DESC
-            LIMIT $1 OFFSET $2
-            """,
-            page_size,
-            offset,
+    """
+    Return paginated hold history (all holds, closed and open), joined with site name.
+    Pass the previous response's `next_cursor` as before_triggered_at/before_id to
+    page by keyset instead of OFFSET; `page` is ignored when a cursor is given.
+    Supplying only half of the cursor is rejected with 422.
+    """
+    if (before_triggered_at is None) != (not before_id):
+        raise HTTPException(
+            status_code=422,
+            detail="before_triggered_at and before_id must be given together",
         )
-        total = await conn.fetchval("SELECT COUNT(*) FROM holds_log")
 
-    return {"items": serialize_rows(rows), "total": total}
+    async with pool.acquire() as conn:
+        if before_triggered_at is not None:
+            rows = await conn.fetch(
+                f"""
+                SELECT {_HISTORY_COLUMNS}
+                FROM holds_log h
+                JOIN sites s ON h.site_id = s.id
+                WHERE (h.triggered_at, h.id) < ($1, $2::uuid)
+                ORDER BY h.triggered_at DESC, h.id DESC
+                LIMIT $3
+                """,
+                before_triggered_at,
+                before_id,
+                page_size,
+            )
+        else:
+            rows = await conn.fetch(
+                f"""
+                SELECT {_HISTORY_COLUMNS}
+                FROM holds_log h
+                JOIN sites s ON h.site_id = s.id
+                ORDER BY h.triggered_at DESC, h.id DESC
+                LIMIT $1 OFFSET $2
+                """,
+                page_size,
+                page * page_size,
+            )
+        total = _total_cache.get("holds")
+        if total is None:
+            total = _total_cache["holds"] = await conn.fetchval("SELECT COUNT(*) FROM holds_log")
+
+    items = serialize_rows(rows)
+    next_cursor = (
+        {"before_triggered_at": items[-1]["triggered_at"], "before_id": items[-1]["id"]}
+        if len(items) == page_size
+        else None
+    )
+    return {"items": items, "total": total, "next_cursor": next_cursor}
 
 
 @router.post("/holds", status_code=201)
@@ -1,41 +1,89 @@
-from fastapi import APIRouter, Depends, Query
+from datetime import datetime
+
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from database import get_pool, serialize_rows
 
 router = APIRouter()
 
+# site_id (or None) → COUNT(*) result; the count scans the log, so reuse it for 30s
+_total_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
+
+
+_LOG_COLUMNS = """
+    n.*, h.trigger_rule,
+    COALESCE(s_d.name, s_h.name) AS site_name
+"""
+
+_LOG_JOINS = """
+    FROM notification_log n
+    LEFT JOIN holds_log h ON n.hold_id = h.id
+    LEFT JOIN sites s_h ON h.site_id = s_h.id
+    LEFT JOIN sites s_d ON n.site_id = s_d.id
+"""
+
 
 @router.get("/logs")
 async def list_logs(
     site_id: str | None = None,
     page: int = Query(0, ge=0),
     page_size: int = Query(50, ge=1, le=200),
+    before_sent_at: datetime | None = Query(None),
+    before_id: str | None = Query(None),
     pool=Depends(get_pool),
 ):
-    """Return paginated notification log entries ordered by most recent first."""
-    offset = page * page_size
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT n.*, h.trigger_rule,
-                   COALESCE(s_d.name, s_h.name) AS site_name
-            FROM notification_log n
-            LEFT JOIN holds_log h ON n.hold_id = h.id
-            LEFT JOIN sites s_h ON h.site_id = s_h.id
-            LEFT JOIN sites s_d ON n.site_id = s_d.id
-            WHERE ($1::uuid IS NULL OR n.site_id = $1::uuid OR h.site_id = $1::uuid)
-            ORDER BY n.sent_at DESC
-            LIMIT $2 OFFSET $3
-            """,
-            site_id, page_size, offset,
-        )
-        total = await conn.fetchval(
-            """
-            SELECT COUNT(*) FROM notification_log n
-            LEFT JOIN holds_log h ON n.hold_id = h.id
-            WHERE ($1::uuid IS NULL OR n.site_id = $1::uuid OR h.site_id = $1::uuid)
-            """,
-            site_id,
+    """
+    Return paginated notification log entries ordered by most recent first.
+    Pass the previous response's `next_cursor` as before_sent_at/before_id to
+    page by keyset instead of OFFSET; `page` is ignored when a cursor is given.
+    Supplying only half of the cursor is rejected with 422.
+    """
+    if (before_sent_at is None) != (not before_id):
+        raise HTTPException(
+            status_code=422,
+            detail="before_sent_at and before_id must be given together",
         )
 
-    return {"items": serialize_rows(rows), "total": total}
+    async with pool.acquire() as conn:
+        if before_sent_at is not None:
+            rows = await conn.fetch(
+                f"""
+                SELECT {_LOG_COLUMNS}
+                {_LOG_JOINS}
+                WHERE ($1::uuid IS NULL OR n.site_id = $1::uuid OR h.site_id = $1::uuid)
+                  AND (n.sent_at, n.id) < ($2, $3::uuid)
+                ORDER BY n.sent_at DESC, n.id DESC
+                LIMIT $4
+                """,
+                site_id, before_sent_at, before_id, page_size,
+            )
+        else:
+            rows = await conn.fetch(
+                f"""
+                SELECT {_LOG_COLUMNS}
+                {_LOG_JOINS}
+                WHERE ($1::uuid IS NULL OR n.site_id = $1::uuid OR h.site_id = $1::uuid)
+                ORDER BY n.sent_at DESC, n.id DESC
+                LIMIT $2 OFFSET $3
+                """,
+                site_id, page_size, page * page_size,
+            )
+        total = _total_cache.get(site_id)
+        if total is None:
+            total = _total_cache[site_id] = await conn.fetchval(
+                """
+                SELECT COUNT(*) FROM notification_log n
+                LEFT JOIN holds_log h ON n.hold_id = h.id
+                WHERE ($1::uuid IS NULL OR n.site_id = $1::uuid OR h.site_id = $1::uuid)
+                """,
+                site_id,
+            )
+
+    items = serialize_rows(rows)
+    next_cursor = (
+        {"before_sent_at": items[-1]["sent_at"], "before_id": items[-1]["id"]}
+        if len(items) == page_size
+        else None
+    )
+    return {"items": items, "total": total, "next_cursor": next_cursor}
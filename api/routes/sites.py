@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from database import get_pool, serialize_row, serialize_rows
-from polling.alerts import send_geotab_message
+from polling.alerts import send_geotab_messages
 
 logger = logging.getLogger(__name__)
 
@@ -83,25 +83,30 @@ class CustomNotify(BaseModel):
 @router.post("/sites/{site_id}/notify")
 async def send_custom_notification(site_id: str, body: CustomNotify, pool=Depends(get_pool)):
     """Send a custom message to specific devices and log to notification_log."""
+    outcomes = await send_geotab_messages([(device_id, body.message) for device_id in body.device_ids])
+
     results = []
-    for device_id in body.device_ids:
-        try:
-            msg_id = await send_geotab_message(device_id, body.message)
-            status = "sent"
-        except Exception as e:
+    rows = []
+    for device_id, outcome in zip(body.device_ids, outcomes):
+        if isinstance(outcome, Exception):
             msg_id = None
-            status = f"failed: {e}"
+            status = f"failed: {outcome}"
+        else:
+            msg_id = outcome
+            status = "sent"
         results.append({"device_id": device_id, "status": status, "geotab_message_id": msg_id})
-        try:
-            async with pool.acquire() as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO notification_log
-                      (site_id, geotab_device_id, message_body, message_type, sent_at, status, geotab_message_id)
-                    VALUES ($1::uuid, $2, $3, 'custom', now(), $4, $5)
-                    """,
-                    site_id, device_id, body.message, status, msg_id,
-                )
-        except Exception as db_err:
-            logger.error(f"[Notify] Failed to log notification for device {device_id}: {db_err}")
+        rows.append((site_id, device_id, body.message, status, msg_id))
+
+    try:
+        async with pool.acquire() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO notification_log
+                  (site_id, geotab_device_id, message_body, message_type, sent_at, status, geotab_message_id)
+                VALUES ($1::uuid, $2, $3, 'custom', now(), $4, $5)
+                """,
+                rows,
+            )
+    except Exception as db_err:
+        logger.error(f"[Notify] Failed to log {len(rows)} notification(s) for site {site_id}: {db_err}")
     return results
@@ -45,11 +45,24 @@ comment on table holds_log is 'OSHA weather work hold records. Open holds have a
 comment on column holds_log.trigger_rule is 'One of: LIGHTNING_30_30, HIGH_WIND_GENERAL, HIGH_WIND_MATERIAL_HANDLING, EXTREME_HEAT';
 comment on column holds_log.vehicles_on_site is 'Snapshot of vehicles confirmed inside the Geotab zone at hold creation time.';
 
+-- Migration (run once against existing Railway DB):
+-- Rows written before the jsonb codec fix hold JSON *strings* instead of objects/arrays.
+-- UPDATE holds_log SET weather_snapshot = (weather_snapshot #>> '{}')::jsonb
+--   WHERE jsonb_typeof(weather_snapshot) = 'string';
+-- UPDATE holds_log SET vehicles_on_site = (vehicles_on_site #>> '{}')::jsonb
+--   WHERE jsonb_typeof(vehicles_on_site) = 'string';
+-- UPDATE holds_log SET notifications_sent = (notifications_sent #>> '{}')::jsonb
+--   WHERE jsonb_typeof(notifications_sent) = 'string';
+
 -- Index for fast "is there an active hold?" lookups
 create index if not exists holds_log_site_active_idx
   on holds_log (site_id, triggered_at desc)
   where all_clear_at is null;
 
+-- Keyset pagination for hold history (GET /api/holds?before_triggered_at=…&before_id=…)
+create index if not exists holds_log_triggered_idx
+  on holds_log (triggered_at desc, id desc);
+
 -- ─── notification_log ─────────────────────────────────────────────────────────
 -- One row per message sent — hold alerts, all-clear alerts, and custom messages.
 create table if not exists notification_log (
@@ -85,6 +98,10 @@ comment on table notification_log is 'Record of every message dispatched by Clea
 
 create index if not exists notification_log_hold_idx on notification_log (hold_id);
 
+-- Keyset pagination for the notification log (GET /api/logs?before_sent_at=…&before_id=…)
+create index if not exists notification_log_sent_idx
+  on notification_log (sent_at desc, id desc);
+
 -- ─── Seed: example sites (replace with real zone IDs) ────────────────────────
 -- Uncomment and edit before running against your Railway PostgreSQL instance.
 -- insert into sites (name, address, lat, lng, geotab_zone_id) values